@@ -1,3 +1,26 @@
-from .benchmarkers import g_benchmarker
+__all__ = ["bench_dict", "g_benchmarker"]
 
-bench_dict = g_benchmarker()
+
+def __getattr__(name):
+    """
+    Resolves the package-level `g_benchmarker` class and the shared `bench_dict` benchmarker on
+    first access, so importing tictoc (e.g. only for the timers in `tictoc.basic`) does not load
+    numpy or set up benchmarking.
+    """
+    if name == "g_benchmarker":
+        from .benchmarkers import g_benchmarker
+
+        return g_benchmarker
+    if name == "bench_dict":
+        from .benchmarkers import g_benchmarker
+
+        bench_dict = globals()["bench_dict"] = g_benchmarker()
+        return bench_dict
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Lists the package-level names, including the ones resolved lazily by `__getattr__`.
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,4 @@
-import time
+from time import perf_counter
 from datetime import datetime
 
 
@@ -17,18 +17,20 @@ class timer:
     """
     A simple timer class offering functionalities like starting, stopping, and retrieving elapsed time.
     """
-        
+
+    __slots__ = ("clock_time",)
+
     def __init__(self) -> None:
         """
         Initializes the timer with the starting time set to the current time.
         """
-        self.clock_time: float = time.perf_counter()
+        self.clock_time: float = perf_counter()
 
     def tic(self):
         """
         Resets the timer by setting the starting time.
         """
-        self.clock_time = time.perf_counter()
+        self.clock_time = perf_counter()
 
     def toc(self) -> float:
         """
@@ -37,7 +39,7 @@ class timer:
         Returns:
             float: The elapsed time in seconds.
         """
-        return time.perf_counter() - self.clock_time
+        return perf_counter() - self.clock_time
 
     def ttoc(self) -> float:
         """
@@ -74,6 +76,8 @@ class count_down_clock(timer):
     Inherits from the `timer` class and adds functionality for a countdown timer.
     """
 
+    __slots__ = ("count_down_time",)
+
     def __init__(self, count_down_time: float = 10.0) -> None:
         """
         Initializes the countdown timer with a starting countdown time and sets the starting time using the parent class constructor.
@@ -123,7 +127,9 @@ class timed_counter:
     """
     A class that combines a timer and a counter, tracking both elapsed time and the number of counts within that time, and can return frequency of counts
     """
-        
+
+    __slots__ = ("timer", "counter", "stop_time", "stop_count", "enabled")
+
     def __init__(self, enabled: bool = True) -> None:
         """
         Initializes the timed counter.
@@ -1,80 +1,224 @@
+import multiprocessing
 import os
-from collections import defaultdict
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
-import matplotlib.pyplot as plt
+from time import perf_counter
 
 import numpy as np
 import csv
 from .basic import timer
 
 
+def _figure():
+    """
+    Creates an 18x6 inch figure with a single axes for the result plots.
+
+    The figure is built without pyplot: it is not registered in pyplot's global state, needs no
+    GUI backend and is rendered by the Agg canvas when saved to PNG. It is freed as soon as it is
+    no longer referenced.
+
+    Returns:
+        tuple: The matplotlib Figure and its Axes.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(18, 6))
+    return fig, fig.subplots()
+
+
+_jet_colormap = None
+
+
+def _jet():
+    """
+    Returns the "jet" colormap used for the bar charts, looked up once and cached.
+
+    Returns:
+        matplotlib.colors.Colormap: The jet colormap.
+    """
+    global _jet_colormap
+    if _jet_colormap is None:
+        import matplotlib
+
+        _jet_colormap = matplotlib.colormaps["jet"]
+    return _jet_colormap
+
+
+def _rescale(values):
+    """
+    Rescales values linearly to the [0, 1] range.
+
+    Args:
+        values (array_like): The values to rescale.
+
+    Returns:
+        np.ndarray: The rescaled values, all zeros if every value is the same.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    low = values.min()
+    spread = values.max() - low
+    if spread == 0:
+        return np.zeros_like(values)
+    return (values - low) / spread
+
+
+def _quartiles(values, counts):
+    """
+    Computes the first and third quartiles of each row with the "midpoint" method,
+    ignoring NaN entries.
+
+    Each row is sorted once (NaN sorts last) and both quartiles are read by indexing, which
+    avoids np.nanpercentile's per-row fallback when NaN values are present.
+
+    Args:
+        values (np.ndarray): 2-D array of samples, with NaN marking missing entries.
+        counts (np.ndarray): The number of non-NaN entries in each row, at least 1.
+
+    Returns:
+        tuple: Arrays holding the first and third quartile of each row.
+    """
+    ordered = np.sort(values, axis=1)
+    rows = np.arange(len(ordered))[:, None]
+    positions = (counts - 1)[:, None] * np.array([0.25, 0.75])
+    low = ordered[rows, np.floor(positions).astype(np.intp)]
+    high = ordered[rows, np.ceil(positions).astype(np.intp)]
+    Q1, Q3 = (0.5 * (low + high)).T
+    return Q1, Q3
+
+
+def _noop(topic="") -> None:
+    """
+    Does nothing. Installed in place of the recording methods of a disabled benchmarker.
+
+    The fixed signature matches `step` and accepts the no-argument calls of the other methods,
+    which is cheaper to call than a `*args, **kwargs` catch-all.
+    """
+
+
+def _save_benchmarkers(benchmarkers, plots=True):
+    """
+    Saves the results of several benchmark instances.
+
+    Args:
+        benchmarkers (list): The benchmark instances to save.
+        plots (bool, optional): Whether to render the PNG plots. Defaults to True.
+    """
+    for bench in benchmarkers:
+        if plots:
+            bench.plot_data()
+        else:
+            bench.data_summary(plots=False)
+
+
+def _save_snapshot(snapshot, plots=True):
+    """
+    Saves the results of benchmark instances pickled by `g_benchmarker.save_async`.
+
+    Args:
+        snapshot (bytes): The pickled list of benchmark instances.
+        plots (bool, optional): Whether to render the PNG plots. Defaults to True.
+    """
+    _save_benchmarkers(pickle.loads(snapshot), plots)
+
+
 class benchmarker:
     """
     A class for benchmarking performance during code execution.
 
     Attributes:
-        enable (bool): Whether benchmarking is enabled. Defaults to True.
+        _enabled (bool): Whether benchmarking is enabled. Defaults to True.
         step_timer (timer): A timer object for tracking step times.
         global_timer (timer): A timer object for tracking overall execution time.
-        global_dict (list): A list of dictionaries storing step times for each step within a benchmark.
-        step_dict (defaultdict(int)): A dictionary storing accumulated time for each step within the current benchmark.
+        topics (dict): Maps each step name to its column in `step_times` and `step_mask`.
+        step_times (np.ndarray): Accumulated time per global step (rows) and step name (columns),
+            preallocated and grown geometrically.
+        step_mask (np.ndarray): Boolean array marking which step names were recorded in each global step.
+        step_count (int): The number of completed global steps stored in `step_times`.
+        step_dict (dict): A copy of the step times accumulated in the current global step.
         file (str): The base filename for storing benchmark results (e.g., "performance/base").
         folder (str): The folder path for storing benchmark results derived from the base filename.
+        name (str): The base name of the results files, used as the plot title.
         started (bool): Flag indicating if a benchmark has been started.
     """
 
     def __init__(self, file="performance/base") -> None:
-        self.enable = True
+        self._enabled = True
         self.step_timer = timer()
         self.global_timer = timer()
-        self.global_dict = []
-        self.step_dict = defaultdict(int)
+        self.topics = {}
+        self.step_times = np.zeros((1024, 8))
+        self.step_mask = np.zeros((1024, 8), dtype=bool)
+        self.step_count = 0
+        # the current global step is accumulated in plain lists indexed like the columns of
+        # `step_times`, gstop writes them to the arrays in one assignment
+        self._row_times = []
+        self._row_mask = []
         self.file = file
-        self.folder = "/".join(file.split("/")[:-1])
+        self.folder = os.path.dirname(file) or "."
+        self._folder_ready = False
+        self.name = os.path.basename(file)
         self.started = False
 
+    # recording methods replaced by `_noop` on the instance while disabled
+    _recording_methods = ("start", "step", "gstep", "gstop")
+
     def enable(self):
         """
-        Enables benchmarking.
+        Enables benchmarking, restoring the recording methods.
         """
-        self.enable = True
+        self._enabled = True
+        for name in self._recording_methods:
+            self.__dict__.pop(name, None)
 
     def disable(self):
         """
         Disables benchmarking.
+
+        The recording methods are shadowed by a no-op on the instance, so calls made while
+        disabled cost a single function call and no checks.
         """
-        self.enable = False
+        self._enabled = False
+        for name in self._recording_methods:
+            setattr(self, name, _noop)
 
     def start(self):
         """
         Starts a new benchmark, resetting step and global timers.
         """
-        if self.enable:
-            self.step_timer.tic()
-            self.global_timer.tic()
-            self.started = True
+        self.step_timer.tic()
+        self.global_timer.tic()
+        self.started = True
 
     def gstep(self):
         """
         Ends the current step within a benchmark, stores accumulated step time,
         resets the step timer, and starts a new step.
         """
-        if self.enable:
-            self.gstop()
-            self.step_dict = defaultdict(int)
-            self.start()
+        self.gstop()
+        columns = len(self.topics)
+        self._row_times = [0.0] * columns
+        self._row_mask = [False] * columns
+        self.start()
 
     def gstop(self):
         """
         Ends the current benchmark, stores accumulated step time for the overall execution,
         and resets the started flag.
         """
-        if self.enable:
-            if self.started:
-                if "global" not in self.step_dict.keys():
-                    self.step_dict["global"] = self.global_timer.ttoc()
-                self.global_dict.append(self.step_dict)
-                self.started = False
+        if self.started:
+            column = self._column("global")
+            if not self._row_mask[column]:
+                self._row_times[column] = self.global_timer.ttoc()
+                self._row_mask[column] = True
+            columns = len(self._row_times)
+            self.step_times[self.step_count, :columns] = self._row_times
+            self.step_mask[self.step_count, :columns] = self._row_mask
+            self.step_count += 1
+            rows, columns = self.step_times.shape
+            if self.step_count == rows:
+                self._resize(2 * rows, columns)
+            self.started = False
 
     def step(self, topic=""):
         """
@@ -83,75 +227,191 @@ class benchmarker:
         Args:
             topic (str, optional): The name of the step being timed. Defaults to "".
         """
-        if self.enable:
-            self.step_dict[topic] += self.step_timer.ttoc()
+        # inlined step_timer.ttoc(), this is the most frequently called method
+        now = perf_counter()
+        step_timer = self.step_timer
+        elapsed = now - step_timer.clock_time
+        step_timer.clock_time = now
+        column = self.topics.get(topic)
+        if column is None:
+            column = self._column(topic)
+        self._row_times[column] += elapsed
+        self._row_mask[column] = True
+
+    @property
+    def global_dict(self) -> list:
+        """
+        The recorded step times as a list with one dictionary per completed global step,
+        built on demand from `step_times`.
+        """
+        names = list(self.topics)
+        global_dict = []
+        for row in range(self.step_count):
+            columns = np.flatnonzero(self.step_mask[row])
+            times = self.step_times[row, columns].tolist()
+            global_dict.append(
+                {names[column]: time for column, time in zip(columns, times)}
+            )
+        return global_dict
+
+    @property
+    def step_dict(self) -> dict:
+        """
+        A copy of the step times accumulated so far in the current global step.
+        """
+        rows = zip(self.topics, self._row_times, self._row_mask)
+        return {name: time for name, time, recorded in rows if recorded}
 
-    def data_summary(self):
+    @property
+    def series(self) -> dict:
+        """
+        The recorded step times per step name, as dictionaries mapping global step number to time,
+        built on demand from `step_times`.
+        """
+        series = {}
+        for name, column in self.topics.items():
+            rows = np.flatnonzero(self.step_mask[: self.step_count, column])
+            if rows.size:
+                times = self.step_times[rows, column]
+                series[name] = dict(zip(rows.tolist(), times.tolist()))
+        return series
+
+    def _column(self, topic):
+        """
+        Returns the column assigned to a step name, registering it on first use.
+        """
+        column = self.topics.get(topic)
+        if column is None:
+            column = len(self.topics)
+            rows, columns = self.step_times.shape
+            if column == columns:
+                self._resize(rows, 2 * columns)
+            self.topics[topic] = column
+            self._row_times.append(0.0)
+            self._row_mask.append(False)
+        return column
+
+    def _resize(self, rows, columns):
+        """
+        Reallocates `step_times` and `step_mask` with a new shape, keeping the recorded data.
+        """
+        step_times = np.zeros((rows, columns))
+        step_mask = np.zeros((rows, columns), dtype=bool)
+        old_rows, old_columns = self.step_times.shape
+        step_times[:old_rows, :old_columns] = self.step_times
+        step_mask[:old_rows, :old_columns] = self.step_mask
+        self.step_times = step_times
+        self.step_mask = step_mask
+
+    def data_summary(self, plots=True):
         """
         Generates a summary of benchmark results, including mean time for each step.
 
         Saves the summary data to a CSV file and creates a bar chart visualization.
+        Nothing is saved if no global step was recorded.
+
+        Args:
+            plots (bool, optional): Whether to draw the bar chart. Defaults to True.
+                Skipping it avoids loading and rendering with matplotlib when only the CSV is needed.
         """
-        if self.enable:
+        if self._enabled:
             self.gstop()
-
-            self.series = defaultdict(dict)
-            for n, i in enumerate(self.global_dict):
-                for key in i.keys():
-                    self.series[key][n] = i[key]
-            means = {
-                k: np.mean(list(self.series[k].values())) for k, v in self.series.items()
-            }
-
-            df = means
-            os.makedirs(self.folder, exist_ok=True)
-            with open(self.file + "_summary.csv", "w", newline="") as csvfile:
-                writer = csv.writer(csvfile)
-                # Write the data to the CSV file
-                for row in df.items():
-                    writer.writerow(row)
-
-            plt.figure(figsize=(18, 6))
-            mymap = plt.get_cmap("jet")
-            plt.title(os.path.basename(self.file) + "_bar")
-            plt.tight_layout()
-            rescale = lambda y: (y - np.min(y)) / (np.max(y) - np.min(y))
-            plt.bar(
-                np.arange(len(df.values())),
-                [i for i in df.values()],
-                label=list(df.keys()),
-                color=mymap(rescale(list(df.values()))),
-            )
-            plt.legend(list(df.keys()))
-            plt.savefig(self.file + "_bar.png", dpi=200)
+            if not self.step_count:
+                return
+            self._write_summary(self._step_stats(), _figure() if plots else None)
 
     def plot_data(self):
         """
         Generates a plot of benchmark results, showing time series data for each step.
 
         Optionally removes outliers using Interquartile Range (IQR).
-        Saves the plot as a PNG image.
-        """
-        if self.enable:
-            self.data_summary()
-            series = self.series
-            plt.figure(figsize=(18, 6))
-            plt.title(os.path.basename(self.file))
-            for keys in series.keys():
-                X = np.array(list(series[keys].keys()))
-                Y = np.array(list(series[keys].values()))
-
-                Q1 = np.percentile(Y, 25, interpolation="midpoint")
-                Q3 = np.percentile(Y, 75, interpolation="midpoint")
-                IQR = Q3 - Q1
-                bool_idx = (Y < (IQR + 1.5 * Q3)) & (Y > (IQR - 1.5 * Q1))
-                X = X[bool_idx]
-                Y = Y[bool_idx]
-
-                plt.plot(X, Y)
-            plt.tight_layout()
-            plt.legend(list(series.keys()))
-            plt.savefig(self.file + ".png", dpi=200)
+        Saves the plot as a PNG image. Nothing is saved if no global step was recorded, and only
+        the summary is saved if there is a single one.
+        """
+        if self._enabled:
+            self.gstop()
+            if not self.step_count:
+                return
+            stats = self._step_stats()
+            # one figure is drawn and saved twice, first as the bar chart then as the time series
+            fig, ax = _figure()
+            self._write_summary(stats, (fig, ax))
+            if self.step_count < 2:
+                return
+            names, times, mask, counts, _ = stats
+
+            # quartiles for every step name at once, NaN marks steps a name was absent
+            values = np.where(mask, times, np.nan)
+            Q1, Q3 = _quartiles(values, counts)
+            IQR = Q3 - Q1
+            # with fewer than 3 samples the midpoint quartiles collapse onto the mean, keep them all
+            inliers = mask & (
+                (
+                    (values <= (Q3 + 1.5 * IQR)[:, None])
+                    & (values >= (Q1 - 1.5 * IQR)[:, None])
+                )
+                | (counts < 3)[:, None]
+            )
+
+            ax.clear()
+            ax.set_title(self.name)
+            for row in range(len(names)):
+                X = np.flatnonzero(inliers[row])
+                ax.plot(X, times[row, X])
+            ax.legend(names)
+            fig.tight_layout()
+            fig.savefig(self.file + ".png", dpi=200)
+
+    def _step_stats(self):
+        """
+        Collects the recorded data of every step name, computed once per save and shared by
+        the CSV summary, the bar chart and the time series plot.
+
+        Returns:
+            tuple: The recorded step names, their times and presence mask as
+                (step name, global step) arrays, their sample counts and their mean times.
+        """
+        times = self.step_times[: self.step_count, : len(self.topics)].T
+        mask = self.step_mask[: self.step_count, : len(self.topics)].T
+        counts = mask.sum(axis=1)
+        recorded = counts > 0
+        names = [name for name, keep in zip(self.topics, recorded) if keep]
+        times, mask, counts = times[recorded], mask[recorded], counts[recorded]
+        means = times.sum(axis=1) / counts
+        return names, times, mask, counts, means
+
+    def _write_summary(self, stats, figure=None):
+        """
+        Saves the mean time of each step to a CSV file and optionally draws them as a bar chart.
+
+        Args:
+            stats (tuple): The step data returned by `_step_stats`.
+            figure (tuple, optional): The Figure and Axes from `_figure` to draw the bar chart on.
+                Defaults to None, in which case no bar chart is drawn.
+        """
+        names, _, _, _, means = stats
+        if not self._folder_ready:
+            os.makedirs(self.folder, exist_ok=True)
+            self._folder_ready = True
+        with open(self.file + "_summary.csv", "w", newline="") as csvfile:
+            writer = csv.writer(csvfile)
+            # Write the data to the CSV file
+            writer.writerows(zip(names, means.tolist()))
+
+        if figure is None:
+            return
+
+        fig, ax = figure
+        ax.set_title(self.name + "_bar")
+        ax.bar(
+            np.arange(len(names)),
+            means,
+            label=names,
+            color=_jet()(_rescale(means)),
+        )
+        ax.legend(names)
+        fig.tight_layout()
+        fig.savefig(self.file + "_bar.png", dpi=200)
 
 
 class g_benchmarker:
@@ -160,21 +420,22 @@ class g_benchmarker:
 
     Attributes:
         benchmarkers (dict): A dictionary storing benchmark instances with names as keys.
-        enable (bool): Whether all benchmarks are enabled. Defaults to True.
+        _enabled (bool): Whether all benchmarks are enabled. Defaults to True.
         time_string (str): A timestamp string for file naming.
     """
 
     def __init__(self) -> None:
         self.benchmarkers = {}
-        self.enable = True
+        self._enabled = True
         today = datetime.now()
         self.time_string = today.strftime("%d:%m:%Y:%H:%M")
+        self._save_executor = None
 
     def enable(self):
         """
         Enables all benchmark instances.
         """
-        self.enable = True
+        self._enabled = True
         for bench in self.benchmarkers.values():
             bench.enable()
 
@@ -182,7 +443,7 @@ class g_benchmarker:
         """
         Disables all benchmark instances.
         """
-        self.enable = False
+        self._enabled = False
         for bench in self.benchmarkers.values():
             bench.disable()
 
@@ -191,7 +452,7 @@ class g_benchmarker:
         Retrieves a specific benchmark instance by name.
 
         If the benchmark instance doesn't exist, a new one is created with a filename based on
-        the provided name and the timestamp string.
+        the provided name and the timestamp string. It starts disabled if benchmarking is disabled.
 
         Args:
             item (str): The name of the benchmark instance to retrieve.
@@ -204,15 +465,49 @@ class g_benchmarker:
             self.benchmarkers[item] = benchmarker(
                 f"performance_{self.time_string}/{item}"
             )
+            if not self._enabled:
+                self.benchmarkers[item].disable()
         return self.benchmarkers[item]
 
-    def save(self):
+    def save(self, plots=True):
         """
         Calls the `plot_data` method on all enabled benchmark instances to save their results.
+
+        Args:
+            plots (bool, optional): Whether to render the PNG plots. Defaults to True.
+                When False only the CSV summaries are written, which skips matplotlib entirely.
+        """
+        if self._enabled:
+            _save_benchmarkers(self.benchmarkers.values(), plots)
+
+    def save_async(self, plots=True) -> Future or None:
         """
-        if self.enable:
+        Saves the results like `save`, but writes the files and renders the plots in a separate
+        process so the caller can keep running.
+
+        Open global steps are closed and the benchmarkers are pickled before returning, so the
+        saved data is the data at call time and steps recorded afterwards are not included. All
+        calls share a single worker process, so saves are written in the order they were
+        requested. The worker is started with the "spawn" method, so the calling script must guard
+        its entry point with `if __name__ == "__main__":`.
+
+        Args:
+            plots (bool, optional): Whether to render the PNG plots. Defaults to True.
+
+        Returns:
+            Future or None: A future that completes once all results are written, or None if disabled.
+        """
+        if self._enabled:
             for bench in self.benchmarkers.values():
-                bench.plot_data()
+                bench.gstop()
+            if self._save_executor is None:
+                self._save_executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            # pickled here rather than by the executor's feeder thread, which would run while
+            # the caller keeps recording
+            snapshot = pickle.dumps(list(self.benchmarkers.values()))
+            return self._save_executor.submit(_save_snapshot, snapshot, plots)
 
 
 class start_bench:
@@ -227,18 +522,13 @@ class start_bench:
     def __iter__(self):
         self.iter_obj = iter(self.dataloader)
         self.n = 0
+        self.length = len(self.dataloader)
+        self.bench = self.bench_handle[self.name]
         return self
 
     def __next__(self):
-        if self.n < len(self.dataloader):
-            self.bench_handle[self.name].gstep()
-            self.n += 1
-            while True:
-                try:
-                    result = next(self.iter_obj)
-                    break
-                except:
-                    raise
-            return result
-        else:
+        if self.n >= self.length:
             raise StopIteration
+        self.bench.gstep()
+        self.n += 1
+        return next(self.iter_obj)